@@ -3,10 +3,7 @@
 
 import logging
 import argparse
-from json import dumps
-from convert.validation import Validation
-from convert.statistics import Statistics
-from convert.utf8mb4converter import UTF8MB4Converter, DEFAULT_CHARSET
+from convert.utf8mb4converter import UTF8MB4Converter, ALGORITHMS, LOCKS, DEFAULT_ALGORITHM
 
 def main (
         args: argparse.Namespace
@@ -26,20 +23,25 @@ def main (
         password = args.password,
         host = args.host,
         port = args.port,
-        db = args.database
+        db = args.database,
+        parallelism = args.parallelism
     )
 
+    # statistics and validation are imported on demand to keep the startup of the conversion minimal
     if args.statistics:
+        from convert.statistics import Statistics
         stats: Statistics = Statistics(db)
         logger.info(f"Database statistics:\n{stats}")
 
     elif args.validate:
+        from json import dumps
+        from convert.validation import Validation
         validator = Validation(db)
-        validation: dict = validator.convert_validate()
+        validation: dict = validator.convert_validate(algorithm=args.algorithm, lock=args.lock)
         logger.info(f"Database conversion validation:\n{dumps(validation, indent=4)}")
 
     else:
-        db.convert_charset_all()
+        db.convert_charset_all(algorithm=args.algorithm, lock=args.lock)
 
 def parse_args (
     ) -> argparse.Namespace:
@@ -56,6 +58,9 @@ def parse_args (
     args_exc: argparse._MutuallyExclusiveGroup = argparser.add_mutually_exclusive_group()
 
     args_opt.add_argument("-v", "--verbose", action="store_true")
+    args_opt.add_argument("-j", "--parallelism", type=int, default=1)
+    args_opt.add_argument("-a", "--algorithm", choices=ALGORITHMS, default=DEFAULT_ALGORITHM)
+    args_opt.add_argument("-l", "--lock", choices=LOCKS)
 
     args_exc.add_argument("-s", "--statistics", action="store_true")
     args_exc.add_argument("-V", "--validate", action="store_true")
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2023 Akumatic
+
+from collections import namedtuple
+from dataclasses import dataclass, field
+
+# information about a single column, as selected from information_schema.COLUMNS
+ColumnInfo = namedtuple("ColumnInfo", ["name", "type", "ctype", "charset", "collation", "nullable", "dvalue"])
+
+@dataclass
+class TableInfo:
+    """
+    Character set information of a single table and its columns.
+
+    Attributes:
+    - charset (str)
+        - The character set of the table
+    - collation (str)
+        - The collation of the table
+    - columns (list)
+        - A list of ColumnInfo tuples, as returned by UTF8MB4Converter.get_columns_of_table
+    """
+
+    charset: str
+    collation: str
+    columns: list = field(default_factory=list)
+
+@dataclass
+class SchemaSnapshot:
+    """
+    Character set information of all tables of a database, fetched once and shared between
+    statistics and conversion to avoid querying the same schema multiple times.
+    The snapshot is not updated by a conversion.
+
+    Attributes:
+    - tables (dict)
+        - A dict mapping each table name to its TableInfo
+    """
+
+    tables: dict = field(default_factory=dict)
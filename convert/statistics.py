@@ -3,6 +3,7 @@
 
 from json import dumps
 from collections import defaultdict
+from .snapshot import SchemaSnapshot
 from .utf8mb4converter import UTF8MB4Converter, DEFAULT_CHARSET
 
 class Statistics:
@@ -16,12 +17,15 @@ class Statistics:
         - A dictionary holding the generated data: Number of tables & columns and character set overview
     - charset (str):
         - A string storing the target charset
+    - snapshot (SchemaSnapshot)
+        - A snapshot of the schema used instead of querying the database, if set
     """
 
     def __init__ (
             self,
             dbcon: UTF8MB4Converter,
-            charset: str = DEFAULT_CHARSET
+            charset: str = DEFAULT_CHARSET,
+            snapshot: SchemaSnapshot = None
         ) -> None:
         """
         Constructor of Statistics object. Generates statistics at creation.
@@ -32,11 +36,15 @@ class Statistics:
         - charset (str):
             - the target charset for comparison
             - default: DEFAULT_CHARSET from class UTF8MB4Converter
+        - snapshot (SchemaSnapshot):
+            - a snapshot of the schema to be used instead of querying the database
+            - default: None
         """
 
         self.dbcon = dbcon
         self.data: dict = None
         self.charset = charset
+        self.snapshot = snapshot
         self.update_stats()
     
     def __str__ (
@@ -74,27 +82,24 @@ class Statistics:
         ) -> None:
         """
         Fetches data from the database and stores it in the object.
+        If a snapshot is stored, the data is generated from the snapshot instead.
         """
 
-        tables = self.dbcon.get_tables()
-
-        # store dict with count of tables and columns
-        count_tab = len(tables)
-        count_col = 0
-
         # store dict with count of different charsets of tables and columns
-        charset_tab = defaultdict(int)
-        charset_col = defaultdict(int)
+        if self.snapshot is None:
+            charset_tab = defaultdict(int, self.dbcon.get_charset_count_tables())
+            charset_col = defaultdict(int, self.dbcon.get_charset_count_columns())
+        else:
+            charset_tab = defaultdict(int)
+            charset_col = defaultdict(int)
+            for table_info in self.snapshot.tables.values():
+                charset_tab[table_info.charset] += 1
+                for column in table_info.columns:
+                    charset_col[column.charset] += 1
 
-        # fill prepared dicts with data
-        for table in tables:
-            charset = self.dbcon.get_charset_table(table)["charset"]
-            charset_tab[charset] += 1
-
-            columns = self.dbcon.get_columns_of_table(table)
-            count_col += len(columns)
-            for column in columns:
-                charset_col[column["charset"]] += 1
+        # store dict with count of tables and columns
+        count_tab = sum(charset_tab.values())
+        count_col = sum(charset_col.values())
         
         # store generated data into the object itself
         self.data = {
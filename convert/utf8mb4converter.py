@@ -4,9 +4,104 @@
 import mariadb
 import logging
 import sys
+import queue
+import threading
+from typing import Callable
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from .snapshot import ColumnInfo, SchemaSnapshot, TableInfo
 
 DEFAULT_CHARSET = "utf8mb4"
 DEFAULT_COLLATION = "utf8mb4_unicode_520_ci"
+DEFAULT_ALGORITHM = "COPY"
+
+# data types widened by "CONVERT TO CHARACTER SET" to keep their maximum length in characters
+WIDENED_TYPES = ("tinytext", "text", "mediumtext")
+# longest VARCHAR (in characters) that still fits into 65535 bytes with 4 bytes per character
+MAX_VARCHAR_LENGTH = 16383
+
+# values supported by the ALGORITHM and LOCK clauses of ALTER TABLE
+ALGORITHMS = ("DEFAULT", "COPY", "INPLACE", "NOCOPY", "INSTANT")
+LOCKS = ("DEFAULT", "NONE", "SHARED", "EXCLUSIVE")
+# error numbers of the server rejecting the requested ALGORITHM or LOCK
+# (ER_ALTER_OPERATION_NOT_SUPPORTED and ER_ALTER_OPERATION_NOT_SUPPORTED_REASON)
+ALTER_NOT_SUPPORTED_ERRNOS = (1845, 1846)
+
+_Q_CHARSET_DB = " ".join((
+    "SELECT DEFAULT_CHARACTER_SET_NAME as charset,",
+    "DEFAULT_COLLATION_NAME as collation",
+    "FROM information_schema.SCHEMATA WHERE schema_name = %s"
+))
+
+_Q_CHARSET_TABLE = " ".join((
+    "SELECT CCSA.character_set_name AS charset,",
+    "table_collation AS collation",
+    "FROM information_schema.TABLES AS T",
+    "JOIN information_schema.COLLATION_CHARACTER_SET_APPLICABILITY AS CCSA",
+    "WHERE T.table_collation = CCSA.collation_name",
+    "AND table_schema = %s AND table_name = %s"
+))
+
+_COLUMN_FIELDS = " ".join((
+    "COLUMN_NAME AS name, DATA_TYPE AS type, COLUMN_TYPE AS ctype,",
+    "CHARACTER_SET_NAME AS charset, COLLATION_NAME as collation,",
+    "IS_NULLABLE AS nullable, COLUMN_DEFAULT AS dvalue"
+))
+
+_Q_COLUMNS = " ".join((
+    f"SELECT {_COLUMN_FIELDS}",
+    "FROM information_schema.COLUMNS",
+    "WHERE table_schema = %s AND table_name = %s"
+))
+
+_Q_TEXT_COLUMNS = f"{_Q_COLUMNS} AND CHARACTER_SET_NAME IS NOT NULL"
+
+_Q_ALL_TABLE_CHARSETS = " ".join((
+    "SELECT table_name AS tab, CCSA.character_set_name AS charset,",
+    "table_collation AS collation",
+    "FROM information_schema.TABLES AS T",
+    "JOIN information_schema.COLLATION_CHARACTER_SET_APPLICABILITY AS CCSA",
+    "WHERE T.table_collation = CCSA.collation_name",
+    "AND table_schema = %s"
+))
+
+_Q_ALL_COLUMNS = " ".join((
+    f"SELECT TABLE_NAME AS tab, {_COLUMN_FIELDS}",
+    "FROM information_schema.COLUMNS",
+    "WHERE table_schema = %s",
+    "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+))
+
+_Q_ALL_TEXT_COLUMNS = " ".join((
+    f"SELECT TABLE_NAME AS tab, {_COLUMN_FIELDS}",
+    "FROM information_schema.COLUMNS",
+    "WHERE table_schema = %s AND CHARACTER_SET_NAME IS NOT NULL",
+    "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+))
+
+_Q_COUNT_TABLE_CHARSETS = " ".join((
+    "SELECT CCSA.character_set_name AS charset, COUNT(*) AS count",
+    "FROM information_schema.TABLES AS T",
+    "JOIN information_schema.COLLATION_CHARACTER_SET_APPLICABILITY AS CCSA",
+    "WHERE T.table_collation = CCSA.collation_name",
+    "AND table_schema = %s",
+    "GROUP BY CCSA.character_set_name"
+))
+
+_Q_COUNT_COLUMN_CHARSETS = " ".join((
+    "SELECT C.CHARACTER_SET_NAME AS charset, COUNT(*) AS count",
+    "FROM information_schema.COLUMNS AS C",
+    "JOIN information_schema.TABLES AS T",
+    "ON C.table_schema = T.table_schema AND C.table_name = T.table_name",
+    "JOIN information_schema.COLLATION_CHARACTER_SET_APPLICABILITY AS CCSA",
+    "ON T.table_collation = CCSA.collation_name",
+    "WHERE C.table_schema = %s",
+    "GROUP BY C.CHARACTER_SET_NAME"
+))
+
+_Q_BEGIN_BULK = "SET @OLD_FOREIGN_KEY_CHECKS = @@FOREIGN_KEY_CHECKS, FOREIGN_KEY_CHECKS = 0"
+
+_Q_END_BULK = "SET FOREIGN_KEY_CHECKS = @OLD_FOREIGN_KEY_CHECKS"
 
 class UTF8MB4Converter:
     """
@@ -19,14 +114,16 @@ class UTF8MB4Converter:
         - Stores host of database connection
     - port (int)
         - Stores port of database connection
+    - parallelism (int)
+        - Number of tables converted in parallel, each worker using its own connection
     - logger (logging.Logger)
         - Logger object for this file
     - _connection (mariadb.Connection)
         - database connection
     - cursor (mariadb.Cursor)
-        - database cursor with keys only
+        - database cursor with keys only, bound to the connection of the current worker thread
     - kcursor (mariadb.Cursor)
-        - database cursor with keys and values
+        - database cursor with keys and values, bound to the connection of the current worker thread
     """
 
     def __init__(
@@ -35,7 +132,8 @@ class UTF8MB4Converter:
             password: str,
             host: str,
             port:int,
-            db: str
+            db: str,
+            parallelism: int = 1
         ) -> None:
         """
         Constructor of UTF8MB4Converter object. Establishes a connection to the given database and stores the cursor.
@@ -45,24 +143,23 @@ class UTF8MB4Converter:
         self.db: str = db
         self.host: str = host
         self.port: int = port
+        self.parallelism: int = parallelism
+        self._user: str = user
+        self._password: str = password
+        self._local: threading.local = threading.local()
+        self._tables_cache: list = None
         self.logger: logging.Logger = logging.getLogger(__name__)
         self.logger.info(f"Connecting to {db}@{host}:{port} as {user}")
         
         try:
-            self._connection: mariadb.Connection = mariadb.connect(
-                user = user,
-                password = password,
-                host = host,
-                port = port,
-                database = db
-            )
+            self._connection: mariadb.Connection = self._connect()
             self.logger.info("Connection established")
         except mariadb.Error as e:
             self.logger.fatal(f"Connection failed: {e}")
             sys.exit()
 
-        self.cursor: mariadb.Cursor = self._connection.cursor(dictionary=False)
-        self.kcursor: mariadb.Cursor = self._connection.cursor(dictionary=True)
+        self._cursor: mariadb.Cursor = self._connection.cursor(dictionary=False)
+        self._kcursor: mariadb.Cursor = self._connection.cursor(dictionary=True)
 
     def __del__(
             self
@@ -74,19 +171,50 @@ class UTF8MB4Converter:
         self.logger.info(f"Connection to {self.db}@{self.host}:{self.port} closed")
         self._connection.close()
 
+    @property
+    def cursor (
+            self
+        ) -> mariadb.Cursor:
+        """
+        Database cursor with keys only. Worker threads get the cursor of their own connection.
+        """
+
+        return getattr(self._local, "cursor", self._cursor)
+
+    @property
+    def kcursor (
+            self
+        ) -> mariadb.Cursor:
+        """
+        Database cursor with keys and values. Worker threads get the cursor of their own connection.
+        """
+
+        return getattr(self._local, "kcursor", self._kcursor)
+
     def get_tables (
             self
         ) -> list:
         """ 
-        Fetches all tables of the given database.
+        Fetches all tables of the given database. The result is cached until invalidate_tables is called.
 
         Returns:
         - List of strings containing names of all tables
         """
         
-        query = f"SHOW TABLES FROM {self.db}"
-        self.cursor.execute(query)
-        return [table[0] for table in self.cursor.fetchall()]
+        if self._tables_cache is None:
+            query = f"SHOW TABLES FROM {self.db}"
+            self.cursor.execute(query)
+            self._tables_cache = [table[0] for table in self.cursor.fetchall()]
+        return self._tables_cache
+
+    def invalidate_tables (
+            self
+        ) -> None:
+        """
+        Clears the cached result of get_tables. Has to be called after tables are created or dropped.
+        """
+
+        self._tables_cache = None
     
     def get_charset_db (
             self
@@ -99,12 +227,7 @@ class UTF8MB4Converter:
           and character set of the stored database.
         """
 
-        query = " ".join((
-            "SELECT DEFAULT_CHARACTER_SET_NAME as charset,",
-            "DEFAULT_COLLATION_NAME as collation",
-            f"FROM information_schema.SCHEMATA WHERE schema_name = '{self.db}'"
-        ))
-        self.kcursor.execute(query)
+        self.kcursor.execute(_Q_CHARSET_DB, (self.db,))
         return self.kcursor.fetchone()
 
     def get_charset_table (
@@ -123,20 +246,13 @@ class UTF8MB4Converter:
           collation and character set of the given table.
         """
 
-        query = " ".join((
-            "SELECT CCSA.character_set_name AS charset,",
-            "table_collation AS collation",
-            "FROM information_schema.TABLES AS T",
-            "JOIN information_schema.COLLATION_CHARACTER_SET_APPLICABILITY AS CCSA", 
-            "WHERE T.table_collation = CCSA.collation_name",
-            f"AND table_schema = '{self.db}' AND table_name = '{table}'"
-        ))
-        self.kcursor.execute(query)
+        self.kcursor.execute(_Q_CHARSET_TABLE, (self.db, table))
         return self.kcursor.fetchone()
     
     def get_columns_of_table (
             self,
-            table: str
+            table: str,
+            text_only: bool = False
         ) -> list:
         """
         Fetches information about the columns of a given table.
@@ -144,22 +260,100 @@ class UTF8MB4Converter:
         Parameters:
         - table (str)
             - the tables whose columns are to be retrieved
+        - text_only (bool)
+            - if set, only columns with a character set are retrieved
+            - default value: False
 
         Returns: 
-        - A list of dicts, containing the column information. Each dict has
-          the keys "name" (Column Name), "type" (Data Type), "ctype" (Column Type),
+        - A list of ColumnInfo tuples, containing the column information. Each tuple has
+          the fields "name" (Column Name), "type" (Data Type), "ctype" (Column Type),
           "charset", "collation", "nullable" and "dvalue" (Column Default)
         """
 
-        query = " ".join((
-            "SELECT COLUMN_NAME AS name, DATA_TYPE AS type, COLUMN_TYPE AS ctype,", 
-            "CHARACTER_SET_NAME AS charset, COLLATION_NAME as collation,", 
-            "IS_NULLABLE AS nullable, COLUMN_DEFAULT AS dvalue",
-            "FROM information_schema.COLUMNS", 
-            f"WHERE table_schema = '{self.db}' AND table_name = '{table}'"
-        ))
-        self.kcursor.execute(query)
-        return self.kcursor.fetchall()
+        self.cursor.execute(_Q_TEXT_COLUMNS if text_only else _Q_COLUMNS, (self.db, table))
+        return [ColumnInfo(*row) for row in self.cursor]
+
+    def get_all_table_charsets (
+            self
+        ) -> dict:
+        """
+        Fetches the character set and collation of all tables of the database with a single query.
+
+        Returns:
+        - A dict mapping each table name to a dict with the keys "charset" and "collation",
+          containing the collation and character set of the table.
+        """
+
+        self.kcursor.execute(_Q_ALL_TABLE_CHARSETS, (self.db,))
+        return {row.pop("tab"): row for row in self.kcursor.fetchall()}
+
+    def get_all_columns (
+            self,
+            text_only: bool = False
+        ) -> dict:
+        """
+        Fetches information about the columns of all tables of the database with a single query.
+
+        Parameters:
+        - text_only (bool)
+            - if set, only columns with a character set are retrieved
+            - default value: False
+
+        Returns:
+        - A dict mapping each table name to a list of ColumnInfo tuples, containing the column information
+          like the ones returned by get_columns_of_table.
+        """
+
+        self.cursor.execute(_Q_ALL_TEXT_COLUMNS if text_only else _Q_ALL_COLUMNS, (self.db,))
+        columns = defaultdict(list)
+        for row in self.cursor:
+            columns[row[0]].append(ColumnInfo(*row[1:]))
+        return columns
+
+    def snapshot (
+            self
+        ) -> SchemaSnapshot:
+        """
+        Fetches the character sets of all tables and the information about all of their columns at once.
+
+        Returns:
+        - A SchemaSnapshot containing one TableInfo per table
+        """
+
+        tables = self.get_all_table_charsets()
+        columns = self.get_all_columns()
+        return SchemaSnapshot({
+            table: TableInfo(info["charset"], info["collation"], columns.get(table, []))
+            for table, info in tables.items()
+        })
+
+    def get_charset_count_tables (
+            self
+        ) -> dict:
+        """
+        Counts the tables of the database per character set. The counting is done by the database server.
+
+        Returns:
+        - A dict mapping each character set to the number of tables using it
+        """
+
+        self.cursor.execute(_Q_COUNT_TABLE_CHARSETS, (self.db,))
+        return dict(self.cursor.fetchall())
+
+    def get_charset_count_columns (
+            self
+        ) -> dict:
+        """
+        Counts the columns of all tables of the database per character set. The counting is done by the database server.
+        Like in get_all_table_charsets and snapshot, views are not included, as they have no collation.
+
+        Returns:
+        - A dict mapping each character set to the number of columns using it.
+          Columns without a character set are counted with the key None.
+        """
+
+        self.cursor.execute(_Q_COUNT_COLUMN_CHARSETS, (self.db,))
+        return dict(self.cursor.fetchall())
 
     def convert_charset_db (
             self,
@@ -215,27 +409,23 @@ class UTF8MB4Converter:
             - default value: utf8mb4_unicode_520_ci
         """
 
+        if not self._is_known_table(table):
+            return
+
         self.logger.debug(f"Start converting character set of table {table} to {charset}")
         table_info = self.get_charset_table(table)
 
         if table_info["charset"] == charset:
             self.logger.debug(f"Table {table} already has character set {charset}")
             return
-        
-        query = f"ALTER TABLE {table} CONVERT TO CHARACTER SET {charset} COLLATE {collation}"
-        try:
-            self.cursor.execute(query)
-            self.logger.debug(f"Character set of table {table} successfully converted to {charset}")
-        except mariadb.Error as e:
-            self.logger.error("\n".join((
-                f"Failed to convert character set of table {table}: {e}",
-                f"-> Query causing the problem: {query}"
-            )))
+
+        self._alter_table_charset(table, charset, collation)
 
     def convert_charset_all_tables (
             self,
             charset: str = DEFAULT_CHARSET,
-            collation: str = DEFAULT_COLLATION
+            collation: str = DEFAULT_COLLATION,
+            snapshot: SchemaSnapshot = None
         ) -> None:
         """
         Alters the charset and collation of all tables of the database.
@@ -247,26 +437,45 @@ class UTF8MB4Converter:
         - collation (str)
             - target collation
             - default value: utf8mb4_unicode_520_ci
+        - snapshot (SchemaSnapshot)
+            - a snapshot of the schema to be used instead of fetching it from the database
+            - default value: None
         """
 
-        tables = self.get_tables()
-        for table in tables:
-            self.convert_charset_single_table(table, charset, collation)
+        if snapshot is None:
+            tables = {table: info["charset"] for table, info in self.get_all_table_charsets().items()}
+        else:
+            tables = {table: info.charset for table, info in snapshot.tables.items()}
+
+        tasks = list()
+        for table, table_charset in tables.items():
+            if table_charset == charset:
+                self.logger.debug(f"Table {table} already has character set {charset}")
+                continue
+            self.logger.debug(f"Start converting character set of table {table} to {charset}")
+            tasks.append((table, charset, collation))
+        self._begin_bulk()
+        try:
+            self._run_parallel(self._alter_table_charset, tasks)
+        finally:
+            self._end_bulk()
 
     def convert_charset_single_column (
             self,
-            column: dict,
+            column: ColumnInfo,
             table: str,
             charset: str = DEFAULT_CHARSET,
             collation: str = DEFAULT_COLLATION,
-            newtype: str = None
+            newtype: str = None,
+            algorithm: str = None,
+            lock: str = None
         ) -> None:
         """
         Alters the charset and collation of a single column.
 
         Parameters:
-        - column (dict)
-            - a dict containig information about the column to be altered
+        - column (ColumnInfo)
+            - a tuple containig information about the column to be altered
         - table (str)
             - the table housing the column
         - newtype (str)
@@ -279,27 +488,25 @@ class UTF8MB4Converter:
         - collation (str)
             - target collation
             - default value: utf8mb4_unicode_520_ci
+        - algorithm (str)
+            - the ALGORITHM used to alter the table, one of ALGORITHMS
+            - default value: None
+        - lock (str)
+            - the LOCK used while altering the table, one of LOCKS
+            - default value: None
         """
 
-        col = column["name"]
+        if not self._is_known_table(table):
+            return
+
+        col = column.name
         self.logger.debug(f"Start converting character set of column {col}(@{table}) to {charset}")
 
-        if not column["charset"]:
-            self.logger.debug(f"Column {col}(@{table}) has no default character set")
-            return
-        if column["charset"] == charset:
-            self.logger.debug(f"Column {col}(@{table}) already has character set {charset}")
+        change = self._get_column_change(column, table, charset, collation, newtype)
+        if change is None:
             return
-        
-        constraint = "NULL" if column["nullable"] == "YES" else "NOT NULL"
-        if column['dvalue'] is not None:
-            constraint += f" DEFAULT {column['dvalue']}"
 
-        query = " ".join((
-            f"ALTER TABLE {table} CHANGE {col} {col}",
-            f"{newtype or column['ctype']} CHARACTER SET {charset} COLLATE {collation}",
-            constraint
-        ))
+        query = f"ALTER TABLE {table} {', '.join([change] + self._get_alter_options(algorithm, lock))}"
         try:
             self.cursor.execute(query)
             self.logger.debug(f"Character set of column {col}(@{table}) successfully converted to {charset}")
@@ -317,6 +524,8 @@ class UTF8MB4Converter:
         ) -> None:
         """
         Alters the charset and collation of all columns of a table.
+        If every column with a character set has to be converted and no column type would be widened,
+        the whole table is converted at once, which also changes the default character set of the table.
 
         Parameters:
         - table (str)
@@ -329,17 +538,21 @@ class UTF8MB4Converter:
             - default value: utf8mb4_unicode_520_ci
         """
 
-        columns = self.get_columns_of_table(table)
-        for column in columns:
-            self.convert_charset_single_column(column, table, charset, collation)
+        if not self._is_known_table(table):
+            return
+
+        columns = self.get_columns_of_table(table, text_only=True)
+        self._convert_columns_of_table(table, columns, charset, collation)
 
     def convert_charset_all_columns_all_tables (
             self,
             charset: str = DEFAULT_CHARSET,
-            collation: str = DEFAULT_COLLATION
+            collation: str = DEFAULT_COLLATION,
+            snapshot: SchemaSnapshot = None
         ) -> None:        
         """
         Alters the charset and collation of all columns of all tables of a database.
+        The columns of each table are altered by a single statement, see convert_charset_all on atomicity.
 
         Parameters:
         - charset (str)
@@ -348,19 +561,40 @@ class UTF8MB4Converter:
         - collation (str)
             - target collation
             - default value: utf8mb4_unicode_520_ci
+        - snapshot (SchemaSnapshot)
+            - a snapshot of the schema to be used instead of fetching it from the database
+            - default value: None
         """
 
-        tables = self.get_tables()
-        for table in tables:
-            self.convert_charset_all_columns_single_table(table, charset, collation)
+        if snapshot is None:
+            tables = self.get_all_columns(text_only=True)
+        else:
+            tables = {
+                table: [column for column in info.columns if column.charset]
+                for table, info in snapshot.tables.items()
+            }
+
+        # tables without any column with a character set don't need to be altered
+        tasks = [(table, columns, charset, collation) for table, columns in tables.items() if columns]
+        self._begin_bulk()
+        try:
+            self._run_parallel(self._convert_columns_of_table, tasks)
+        finally:
+            self._end_bulk()
 
     def convert_charset_all (
             self,
             charset: str = DEFAULT_CHARSET,
-            collation: str = DEFAULT_COLLATION
+            collation: str = DEFAULT_COLLATION,
+            snapshot: SchemaSnapshot = None,
+            algorithm: str = DEFAULT_ALGORITHM,
+            lock: str = None
         ) -> None:
         """
-        Alters the charset and collation of the database, all columns and all tables
+        Alters the charset and collation of the database, all columns and all tables.
+        Each table is altered together with its columns by a single statement, so it is only rebuilt once.
+        ALTER TABLE implicitly commits and can't be part of a transaction, so a failing table doesn't
+        affect the conversion of the other tables.
 
         Parameters:
         - charset (str)
@@ -369,8 +603,449 @@ class UTF8MB4Converter:
         - collation (str)
             - target collation
             - default value: utf8mb4_unicode_520_ci
+        - snapshot (SchemaSnapshot)
+            - a snapshot of the schema to be used instead of fetching it from the database
+            - default value: None
+        - algorithm (str)
+            - the ALGORITHM used to alter the tables, one of ALGORITHMS
+            - if no algorithm is entered, the server decides
+            - default value: COPY
+        - lock (str)
+            - the LOCK used while altering the tables, one of LOCKS
+            - if no lock is entered, the server decides
+            - default value: None
         """
 
         self.convert_charset_db(charset, collation)
-        self.convert_charset_all_columns_all_tables(charset, collation)
-        self.convert_charset_all_tables(charset, collation)
\ No newline at end of file
+        if snapshot is None:
+            snapshot = self.snapshot()
+
+        tasks = [
+            (table, table_info, charset, collation, algorithm, lock)
+            for table, table_info in snapshot.tables.items()
+        ]
+        self._begin_bulk()
+        try:
+            self._run_parallel(self._convert_table, tasks)
+        finally:
+            self._end_bulk()
+
+    def _convert_table (
+            self,
+            table: str,
+            table_info: TableInfo,
+            charset: str,
+            collation: str,
+            algorithm: str = None,
+            lock: str = None
+        ) -> None:
+        """
+        Alters the charset and collation of a table and all of its columns with a single statement.
+
+        Parameters:
+        - table (str)
+            - the table to be altered
+        - table_info (TableInfo)
+            - the character set information of the table and its columns
+        - charset (str)
+            - target character set
+        - collation (str)
+            - target collation
+        - algorithm (str)
+            - the ALGORITHM used to alter the table, one of ALGORITHMS
+            - default value: None
+        - lock (str)
+            - the LOCK used while altering the table, one of LOCKS
+            - default value: None
+        """
+
+        columns = [column for column in table_info.columns if column.charset]
+        changes = [self._get_column_change(column, table, charset, collation) for column in columns]
+        changes = [change for change in changes if change is not None]
+        convert_table = table_info.charset != charset
+
+        if not changes and not convert_table:
+            self.logger.debug(f"Table {table} and its columns already have character set {charset}")
+            return
+
+        self.logger.debug(f"Start converting character set of table {table} and its columns to {charset}")
+        if self._can_convert_table(columns, changes):
+            clauses = [f"CONVERT TO CHARACTER SET {charset} COLLATE {collation}"]
+        else:
+            clauses = changes
+            if convert_table:
+                clauses.append(f"DEFAULT CHARACTER SET {charset} COLLATE {collation}")
+        clauses += self._get_alter_options(algorithm, lock)
+
+        query = f"ALTER TABLE {table} {', '.join(clauses)}"
+        try:
+            self.cursor.execute(query)
+            self.logger.debug(f"Character set of table {table} and its columns successfully converted to {charset}")
+        except mariadb.Error as e:
+            # retrying with the same ALGORITHM or LOCK would fail again, and retrying without them
+            # would ignore the choice of the user
+            if getattr(e, "errno", None) in ALTER_NOT_SUPPORTED_ERRNOS:
+                self.logger.error("\n".join((
+                    f"Failed to convert character set of table {table}: {e}",
+                    f"-> Query causing the problem: {query}",
+                    "-> Requested ALGORITHM or LOCK is not supported, table is skipped"
+                )))
+                return
+
+            self.logger.warning("\n".join((
+                f"Failed to convert character set of table {table}: {e}",
+                f"-> Query causing the problem: {query}",
+                "-> Converting columns and table one by one instead"
+            )))
+            for column in columns:
+                self.convert_charset_single_column(column, table, charset, collation, algorithm=algorithm, lock=lock)
+            if convert_table:
+                self._alter_table_default_charset(table, charset, collation, algorithm, lock)
+
+    def _convert_columns_of_table (
+            self,
+            table: str,
+            columns: list,
+            charset: str,
+            collation: str
+        ) -> None:
+        """
+        Alters the charset and collation of the given columns of a table, see convert_charset_all_columns_single_table.
+        The table name is not checked, so it has to be taken from the database itself.
+
+        Parameters:
+        - table (str)
+            - the table containing the columns
+        - columns (list)
+            - the column information of the table, as returned by get_columns_of_table
+        - charset (str)
+            - target character set
+        - collation (str)
+            - target collation
+        """
+
+        # collect all column changes into a single statement, so the table is only rebuilt once
+        changes = [self._get_column_change(column, table, charset, collation) for column in columns]
+        changes = [change for change in changes if change is not None]
+        if not changes:
+            return
+
+        self.logger.debug(f"Start converting character set of {len(changes)} columns of table {table} to {charset}")
+        if self._can_convert_table(columns, changes):
+            query = f"ALTER TABLE {table} CONVERT TO CHARACTER SET {charset} COLLATE {collation}"
+        else:
+            query = f"ALTER TABLE {table} {', '.join(changes)}"
+        try:
+            self.cursor.execute(query)
+            self.logger.debug(f"Character set of columns of table {table} successfully converted to {charset}")
+        except mariadb.Error as e:
+            self.logger.warning("\n".join((
+                f"Failed to convert character set of columns of table {table}: {e}",
+                f"-> Query causing the problem: {query}",
+                "-> Converting columns one by one instead"
+            )))
+            for column in columns:
+                self.convert_charset_single_column(column, table, charset, collation)
+
+    def _alter_table_charset (
+            self,
+            table: str,
+            charset: str,
+            collation: str
+        ) -> None:
+        """
+        Alters the charset and collation of a single table without checking its current character set first.
+
+        Parameters:
+        - table (str)
+            - the table to be altered
+        - charset (str)
+            - target character set
+        - collation (str)
+            - target collation
+        """
+
+        query = f"ALTER TABLE {table} CONVERT TO CHARACTER SET {charset} COLLATE {collation}"
+        try:
+            self.cursor.execute(query)
+            self.logger.debug(f"Character set of table {table} successfully converted to {charset}")
+        except mariadb.Error as e:
+            self.logger.error("\n".join((
+                f"Failed to convert character set of table {table}: {e}",
+                f"-> Query causing the problem: {query}"
+            )))
+
+    def _get_column_change (
+            self,
+            column: ColumnInfo,
+            table: str,
+            charset: str,
+            collation: str,
+            newtype: str = None
+        ) -> str:
+        """
+        Builds the CHANGE clause of an ALTER TABLE statement converting a single column.
+
+        Parameters:
+        - column (ColumnInfo)
+            - a tuple containig information about the column to be altered
+        - table (str)
+            - the table housing the column
+        - charset (str)
+            - target character set
+        - collation (str)
+            - target collation
+        - newtype (str)
+            - enter a new type if it should be changed
+            - if no type is entered, the type is kept
+            - default value: None
+
+        Returns:
+        - The CHANGE clause as string, or None if the column does not need to be converted
+        """
+
+        col = column.name
+        if not column.charset:
+            self.logger.debug(f"Column {col}(@{table}) has no default character set")
+            return None
+        if column.charset == charset:
+            self.logger.debug(f"Column {col}(@{table}) already has character set {charset}")
+            return None
+
+        constraint = "NULL" if column.nullable == "YES" else "NOT NULL"
+        if column.dvalue is not None:
+            constraint += f" DEFAULT {column.dvalue}"
+
+        return " ".join((
+            f"CHANGE {col} {col}",
+            f"{newtype or column.ctype} CHARACTER SET {charset} COLLATE {collation}",
+            constraint
+        ))
+
+    def _can_convert_table (
+            self,
+            columns: list,
+            changes: list
+        ) -> bool:
+        """
+        Checks whether all columns of a table can be converted with "CONVERT TO CHARACTER SET"
+        instead of changing each column on its own.
+
+        Parameters:
+        - columns (list)
+            - the column information of the table, as returned by get_columns_of_table
+        - changes (list)
+            - the CHANGE clauses built for the columns that need to be converted
+
+        Returns:
+        - True if every column with a character set needs to be converted and none of them
+          would have its type widened by the conversion, otherwise False
+        """
+
+        charset_columns = [column for column in columns if column.charset]
+        if len(changes) != len(charset_columns):
+            return False
+
+        for column in charset_columns:
+            if column.type in WIDENED_TYPES:
+                return False
+            if column.type == "varchar" and int(column.ctype[8:-1]) > MAX_VARCHAR_LENGTH:
+                return False
+        return True
+
+    def _connect (
+            self
+        ) -> mariadb.Connection:
+        """
+        Establishes a new connection to the stored database.
+        MariaDB Connector/Python negotiates utf8mb4 as connection character set during the handshake,
+        so no SET NAMES statement is needed and the server has to support utf8mb4.
+
+        Returns:
+        - The established database connection
+
+        Raises:
+        - mariadb.Error
+            - Raised when the connection fails
+        """
+
+        return mariadb.connect(
+            user = self._user,
+            password = self._password,
+            host = self.host,
+            port = self.port,
+            database = self.db
+        )
+
+    def _alter_table_default_charset (
+            self,
+            table: str,
+            charset: str,
+            collation: str,
+            algorithm: str = None,
+            lock: str = None
+        ) -> None:
+        """
+        Alters the default charset and collation of a single table, leaving its columns untouched.
+
+        Parameters:
+        - table (str)
+            - the table to be altered
+        - charset (str)
+            - target character set
+        - collation (str)
+            - target collation
+        - algorithm (str)
+            - the ALGORITHM used to alter the table, one of ALGORITHMS
+            - default value: None
+        - lock (str)
+            - the LOCK used while altering the table, one of LOCKS
+            - default value: None
+        """
+
+        clauses = [f"DEFAULT CHARACTER SET {charset} COLLATE {collation}"] + self._get_alter_options(algorithm, lock)
+        query = f"ALTER TABLE {table} {', '.join(clauses)}"
+        try:
+            self.cursor.execute(query)
+            self.logger.debug(f"Default character set of table {table} successfully converted to {charset}")
+        except mariadb.Error as e:
+            self.logger.error("\n".join((
+                f"Failed to convert default character set of table {table}: {e}",
+                f"-> Query causing the problem: {query}"
+            )))
+
+    def _get_alter_options (
+            self,
+            algorithm: str = None,
+            lock: str = None
+        ) -> list:
+        """
+        Builds the ALGORITHM and LOCK clauses of an ALTER TABLE statement.
+
+        Parameters:
+        - algorithm (str)
+            - the ALGORITHM used to alter the table, one of ALGORITHMS
+            - default value: None
+        - lock (str)
+            - the LOCK used while altering the table, one of LOCKS
+            - default value: None
+
+        Returns:
+        - A list containing the clauses for the given values, empty if none are given
+        """
+
+        options = list()
+        if algorithm:
+            options.append(f"ALGORITHM={algorithm}")
+        if lock:
+            options.append(f"LOCK={lock}")
+        return options
+
+    def _run_parallel (
+            self,
+            task: Callable,
+            tasks: list
+        ) -> None:
+        """
+        Calls the given function once per argument tuple. If parallelism is greater than 1, the calls are
+        distributed among worker threads, each with its own connection. Foreign key checks are disabled
+        in the sessions of the workers, as tables referencing each other may be converted at the same time.
+        Workers whose connection can't be prepared are dropped; without any usable worker, the calls are made sequentially.
+
+        Parameters:
+        - task (Callable)
+            - the function to be called
+        - tasks (list)
+            - a list of argument tuples, one per call
+        """
+
+        workers = min(self.parallelism, len(tasks))
+        if workers <= 1:
+            for args in tasks:
+                task(*args)
+            return
+
+        # connect and prepare the worker sessions up front, connections failing to do so are dropped
+        connections = list()
+        cursors: queue.Queue = queue.Queue()
+        for _ in range(workers):
+            try:
+                connection: mariadb.Connection = self._connect()
+            except mariadb.Error as e:
+                self.logger.error(f"Failed to establish worker connection: {e}")
+                continue
+            connections.append(connection)
+            try:
+                cursor: mariadb.Cursor = connection.cursor(dictionary=False)
+                cursor.execute(_Q_BEGIN_BULK)
+                cursors.put((cursor, connection.cursor(dictionary=True)))
+            except mariadb.Error as e:
+                self.logger.error(f"Failed to initialize worker connection: {e}")
+
+        workers = cursors.qsize()
+        if workers == 0:
+            for connection in connections:
+                connection.close()
+            self.logger.error("No usable worker connections -> Continuing sequentially")
+            for args in tasks:
+                task(*args)
+            return
+
+        def init_worker () -> None:
+            self._local.cursor, self._local.kcursor = cursors.get()
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+                futures = [executor.submit(task, *args) for args in tasks]
+                for future in futures:
+                    future.result()
+        finally:
+            for connection in connections:
+                connection.close()
+
+    def _is_known_table (
+            self,
+            table: str
+        ) -> bool:
+        """
+        Checks whether a table exists in the database. Table names can't be passed as query
+        parameters, so names passed from outside are checked before being used in a query.
+
+        Parameters:
+        - table (str)
+            - the name of the table to be checked
+
+        Returns:
+        - True if the table exists in the database, otherwise False
+        """
+
+        if table in self.get_tables():
+            return True
+        self.logger.error(f"Table {table} does not exist in database {self.db}")
+        return False
+
+    def _begin_bulk (
+            self
+        ) -> None:
+        """
+        Disables foreign key checks for the session of the current cursor before bulk conversions.
+        The previous values are kept in session variables and restored by _end_bulk.
+        """
+
+        self.cursor.execute(_Q_BEGIN_BULK)
+
+    def _end_bulk (
+            self
+        ) -> None:
+        """
+        Restores the foreign key checks of the session of the current cursor after bulk conversions.
+        Errors are only logged, so they don't hide an error raised during the conversion.
+        """
+
+        try:
+            self.cursor.execute(_Q_END_BULK)
+        except mariadb.Error as e:
+            self.logger.error("\n".join((
+                f"Failed to restore foreign key checks: {e}",
+                f"-> Query causing the problem: {_Q_END_BULK}"
+            )))
\ No newline at end of file
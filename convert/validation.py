@@ -2,7 +2,13 @@
 # Copyright (c) 2023 Akumatic
 
 from collections import defaultdict
-from convert.utf8mb4converter import UTF8MB4Converter
+from convert.snapshot import SchemaSnapshot
+from convert.utf8mb4converter import UTF8MB4Converter, DEFAULT_ALGORITHM
+
+# information schema fields expected to change during character set conversion
+IGNORED_KEYS = frozenset(("CHARACTER_SET_NAME", "COLLATION_NAME", "CHARACTER_OCTET_LENGTH"))
+
+_Q_STATE = "SELECT * FROM information_schema.COLUMNS WHERE table_schema = %s"
 
 class MissingStateException(Exception):
     """
@@ -17,10 +23,14 @@ class Validation:
     Attributes:
     - dbcon (UTF8MB4Converter)
         - The converter object storing the database information and connection 
-    - start (defaultdict)
+    - start (dict)
         - A dictionary holding the state of the database, before conversion.
-    - end (defaultdict)
+    - end (dict)
         - A dictionary holding the state of the database, after conversion.
+    - keys (list)
+        - The names of the information schema fields, in the order of the stored column tuples.
+    - skip (frozenset)
+        - The indices of the fields in IGNORED_KEYS within the stored column tuples.
     """
 
     def __init__ (
@@ -36,8 +46,10 @@ class Validation:
         """
 
         self.dbcon: UTF8MB4Converter = dbcon
-        self.start: defaultdict = None
-        self.end: defaultdict = None
+        self.start: dict = None
+        self.end: dict = None
+        self.keys: list = None
+        self.skip: frozenset = None
 
     def generate_start_state (
             self
@@ -80,39 +92,50 @@ class Validation:
         summary: dict = {"unaltered": 0, "altered": 0}
         details: defaultdict = defaultdict(dict)
 
-        for table in self.start.keys():
-            a: dict = self.start[table]
-            b: dict = self.end[table]
-            for column in a.keys():
-                comp: dict = self._get_differences(a[column], b[column])
-                if len(comp) == 0:
-                    summary["unaltered"] += 1
-                else:
-                    summary["altered"] += 1
-                    details[table][column] = comp
+        for (table, column), a in self.start.items():
+            comp: dict = self._get_differences(a, self.end[(table, column)])
+            if len(comp) == 0:
+                summary["unaltered"] += 1
+            else:
+                summary["altered"] += 1
+                details[table][column] = comp
 
         return {"summary": summary, "details": details}
     
     def convert_validate (
-            self
+            self,
+            snapshot: SchemaSnapshot = None,
+            algorithm: str = DEFAULT_ALGORITHM,
+            lock: str = None
         ) -> dict:
         """
         Alters the charset and collation of the database, all columns and all tables.
         Validates that no other field was changed.
 
+        Parameters:
+        - snapshot (SchemaSnapshot)
+            - a snapshot of the schema passed on to the conversion instead of fetching it again
+            - default value: None
+        - algorithm (str)
+            - the ALGORITHM used to alter the tables, see UTF8MB4Converter.convert_charset_all
+            - default value: COPY
+        - lock (str)
+            - the LOCK used while altering the tables, see UTF8MB4Converter.convert_charset_all
+            - default value: None
+
         Returns:
         - A dict containing a numeric summary and details about mismatched columns.
         """
 
         self.generate_start_state()
-        self.dbcon.convert_charset_all()
+        self.dbcon.convert_charset_all(snapshot=snapshot, algorithm=algorithm, lock=lock)
         self.generate_end_state()
         return self.compare_states()
 
     def _get_differences (
             self,
-            a: dict,
-            b: dict
+            a: tuple,
+            b: tuple
         ) -> dict:
         """
         Compares two given column data sets and compares the values for all keys
@@ -121,70 +144,50 @@ class Validation:
         for each column.
 
         Parameters:
-        - a (dict)
-            - A dictionary containing the information schema of a column.
-        - b (dict)
-            - A dictionary containing the information schema of a column
-            - Used for comparison with dictionary a
+        - a (tuple)
+            - A tuple containing the information schema of a column, ordered like the keys attribute.
+        - b (tuple)
+            - A tuple containing the information schema of a column, ordered like the keys attribute.
+            - Used for comparison with tuple a
 
         Returns:
-        - A dict with the keys and values of deviations between the two given dicts,
+        - A dict with the keys and values of deviations between the two given tuples,
           ignoring certain values changed by character set conversion.
         """
 
         data = dict()
-        keys = a.keys()
-        for key in keys:
-            if key == "CHARACTER_SET_NAME":
-                continue
-            if key == "COLLATION_NAME":
-                continue
-            if key == "CHARACTER_OCTET_LENGTH":
+        if a == b:
+            return data
+
+        for i, key in enumerate(self.keys):
+            if i in self.skip:
                 continue
-            if a[key] != b[key]:
+            if a[i] != b[i]:
                 data[key] = {
-                    "Before": a[key],
-                    "After": b[key]
+                    "Before": a[i],
+                    "After": b[i]
                 }
         return data
     
-    def _get_columns_of_table (
-            self,
-            table: str
-        ) -> list:
-        """
-        Fetches all information about the columns of a given table.
-
-        Parameters: 
-        - table (str)
-            - the tabke whose columns are to be retrieved
-
-        Returns:
-        - A list of dicts, containing the full column information.
-        """
-
-        query = " ".join((
-            "SELECT * FROM information_schema.COLUMNS", 
-            f"WHERE table_schema = '{self.dbcon.db}' AND table_name = '{table}'"
-        ))
-        self.dbcon.kcursor.execute(query)
-        return self.dbcon.kcursor.fetchall()
-    
     def _get_state (
             self
-        ) -> defaultdict:
+        ) -> dict:
         """
         Fetches column schema of the database and stores it for each table and column.
+        The field names of the column schema are stored in the keys attribute.
 
         Returns:
-        - A defaultdict that contains one dictionary for each table.
-          Each table dictionary contains one dict per column, which contains the column schema.
+        - A dict that maps each (table, column) pair to a tuple containing the column schema.
         """
 
-        state: defaultdict = defaultdict(dict)
-        tables: list = self.dbcon.get_tables()
-        for table in tables:
-            columns: list = self._get_columns_of_table(table)
-            for column in columns:
-                state[table][column["COLUMN_NAME"]] = column
+        cursor = self.dbcon.cursor
+        cursor.execute(_Q_STATE, (self.dbcon.db,))
+        self.keys = [description[0] for description in cursor.description]
+        self.skip = frozenset(i for i, key in enumerate(self.keys) if key in IGNORED_KEYS)
+        table_idx: int = self.keys.index("TABLE_NAME")
+        column_idx: int = self.keys.index("COLUMN_NAME")
+
+        state: dict = dict()
+        for row in cursor:
+            state[(row[table_idx], row[column_idx])] = tuple(row)
         return state
\ No newline at end of file